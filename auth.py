@@ -0,0 +1,55 @@
+import os
+import sqlite3
+import bcrypt
+import streamlit as st
+
+# --- Helper Functions ---
+# bcrypt cost factor; each extra round doubles hashing time
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Hashing the password with bcrypt
+def hash_password(password):
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)  # Generates a salt
+    return bcrypt.hashpw(password.encode(), salt)  # Hash is stored as raw bytes
+
+# Check if the input password matches the stored hashed password
+def check_password(input_password, stored_hashed_password):
+    # Rows written before the BLOB column may still hold the hash as text
+    if isinstance(stored_hashed_password, str):
+        stored_hashed_password = stored_hashed_password.encode('utf-8')
+    return bcrypt.checkpw(input_password.encode(), stored_hashed_password)
+
+# Reset the password in the database; returns False if the user does not exist
+def reset_password(username, new_password, conn):
+    hashed = hash_password(new_password)
+    cursor = conn.execute("UPDATE users SET password = ? WHERE username = ?", (hashed, username))
+    conn.commit()
+    return cursor.rowcount > 0
+
+# --- Login/Register Logic ---
+# Stand-in hash checked for unknown usernames so every login costs one bcrypt check.
+# Fixed at the cost existing accounts were hashed with, not BCRYPT_ROUNDS, and built once at import.
+DUMMY_HASH = bcrypt.hashpw(b"careconnect", bcrypt.gensalt(rounds=12))
+
+def login(username, password, conn):
+    cursor = conn.execute("SELECT password, role FROM users WHERE username = ?", (username,))
+    result = cursor.fetchone()
+    stored = result[0] if result else DUMMY_HASH
+    with st.spinner("Authenticating..."):
+        valid = check_password(password, stored)
+    if valid and result:
+        st.session_state.authenticated = True
+        st.session_state.username = username
+        st.session_state.role = result[1]
+        st.rerun()  # Switch to the dashboard now instead of on the next interaction
+    else:
+        st.error("Invalid username or password")
+
+def register(username, password, role, conn):
+    hashed = hash_password(password)
+    try:
+        with conn:  # Rolls back on IntegrityError so the shared connection is not left holding the write lock
+            conn.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)", (username, hashed, role))
+        st.success("Registered successfully! You can now log in.")
+    except sqlite3.IntegrityError:
+        st.error("Username already exists.")
@@ -0,0 +1,134 @@
+import sqlite3
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import streamlit as st
+
+# --- Connect to Database ---
+DB_PATH = "data/careconnect.db"
+
+# WAL lets readers run alongside form commits; mmap serves scans from the page cache
+PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+           "cache_size=-65536", "mmap_size=268435456")
+
+@st.cache_resource
+def get_connection():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    for pragma in PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+# --- SQL Statements ---
+# Kept as constants so every call reuses sqlite3's cached prepared statement
+INSERT_PATIENT = "INSERT INTO patients (name, age, gender, contact) VALUES (?, ?, ?, ?)"
+INSERT_DOCTOR = "INSERT INTO doctors (name, specialty) VALUES (?, ?)"
+INSERT_APPOINTMENT = """INSERT INTO appointments (patient_id, doctor_id, appointment_date, status, diagnosis)
+                        VALUES (?, ?, ?, ?, ?)"""
+PATIENT_CSV_COLUMNS = ["name", "age", "gender", "contact"]
+
+# --- Initialize Database ---
+# Cached per process so the DDL is parsed once, not on every rerun
+@st.cache_resource
+def init_db(_conn):
+    _conn.execute('''CREATE TABLE IF NOT EXISTS users (
+        username TEXT PRIMARY KEY,
+        password BLOB,
+        role TEXT
+    )''')
+    _conn.execute('''CREATE TABLE IF NOT EXISTS patients (
+        patient_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        age INTEGER,
+        gender TEXT,
+        contact TEXT
+    )''')
+    _conn.execute('''CREATE TABLE IF NOT EXISTS doctors (
+        doctor_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        specialty TEXT
+    )''')
+    _conn.execute('''CREATE TABLE IF NOT EXISTS appointments (
+        appointment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        patient_id INTEGER,
+        doctor_id INTEGER,
+        appointment_date DATE,
+        status TEXT,
+        diagnosis TEXT,
+        FOREIGN KEY(patient_id) REFERENCES patients(patient_id),
+        FOREIGN KEY(doctor_id) REFERENCES doctors(doctor_id)
+    )''')
+    _conn.execute("CREATE INDEX IF NOT EXISTS idx_appt_patient ON appointments(patient_id)")
+    _conn.execute("CREATE INDEX IF NOT EXISTS idx_appt_doctor ON appointments(doctor_id)")
+    _conn.execute("CREATE INDEX IF NOT EXISTS idx_appt_date ON appointments(appointment_date)")
+    _conn.execute('''CREATE VIEW IF NOT EXISTS appointments_view AS
+        SELECT a.appointment_id, p.name AS patient, d.name AS doctor,
+               a.appointment_date, a.status, a.diagnosis
+        FROM appointments a
+        JOIN patients p ON a.patient_id = p.patient_id
+        JOIN doctors d ON a.doctor_id = d.doctor_id''')
+    _conn.commit()
+    return True
+
+# --- Cached Tables ---
+PAGE_SIZE = 50
+
+# Ages fit in 0-120, so one byte per row instead of int64's eight; nullable types keep NULLs readable
+PATIENT_DTYPES = {"patient_id": "Int32", "age": "UInt8"}
+
+# A column is narrowed only when every stored value fits; otherwise it is shown as stored
+def narrow_dtypes(df, dtypes):
+    for column, dtype in dtypes.items():
+        values = pd.to_numeric(df[column], errors="coerce")
+        info = np.iinfo(pd.api.types.pandas_dtype(dtype).numpy_dtype)
+        fits = values.between(info.min, info.max) & (values % 1 == 0)
+        if (fits | df[column].isna()).all():
+            df[column] = values.astype(dtype)
+    return df
+
+# SQLite lets one column hold mixed types (an age stored as text); Arrow needs those as text
+def to_arrow(df):
+    for column in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[column], skipna=True) not in ("string", "bytes", "empty"):
+            df[column] = df[column].astype("string")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+# Kept as Arrow so reruns skip the pandas-to-Arrow conversion; st.dataframe renders it as-is
+@st.cache_data(ttl=60)
+def query_arrow(sql, params=(), dtypes=None):
+    df = pd.read_sql_query(sql, get_connection(), params=params)
+    if dtypes:
+        df = narrow_dtypes(df, dtypes)
+    return to_arrow(df)
+
+# Written batch by batch; Arrow formats each one straight into a single buffer, with no Python str.
+# Not cached: it only runs when a download is clicked, so no full export is held between reruns.
+def export_csv(sql, batch_size=10_000):
+    buf = pa.BufferOutputStream()
+    for i, batch in enumerate(pd.read_sql_query(sql, get_connection(), chunksize=batch_size)):
+        pa_csv.write_csv(to_arrow(batch), buf, pa_csv.WriteOptions(include_header=i == 0))
+    return buf.getvalue().to_pybytes()
+
+@st.cache_data(ttl=60)
+def row_count(source):
+    return get_connection().execute(f"SELECT COUNT(*) FROM {source}").fetchone()[0]
+
+def clear_table_caches():
+    query_arrow.clear()
+    row_count.clear()
+    record_counts.clear()
+
+# --- Cached Lookups ---
+@st.cache_data(ttl=30)
+def patient_options():
+    return get_connection().execute("SELECT patient_id, name FROM patients").fetchall()
+
+@st.cache_data(ttl=30)
+def doctor_options():
+    return get_connection().execute("SELECT doctor_id, name FROM doctors").fetchall()
+
+@st.cache_data(ttl=60)
+def record_counts():
+    return get_connection().execute("""SELECT (SELECT COUNT(*) FROM patients),
+                                              (SELECT COUNT(*) FROM doctors),
+                                              (SELECT COUNT(*) FROM appointments)""").fetchone()
@@ -0,0 +1,190 @@
+import csv
+import io
+from datetime import date
+import streamlit as st
+from auth import login, register, reset_password
+from db import (INSERT_APPOINTMENT, INSERT_DOCTOR, INSERT_PATIENT, PAGE_SIZE, PATIENT_CSV_COLUMNS,
+                PATIENT_DTYPES, clear_table_caches, doctor_options, export_csv, patient_options,
+                query_arrow, record_counts, row_count)
+
+# --- Table Rendering ---
+# Only the selected page is queried and sent to the browser; the CSV still covers every row
+def show_table(source, columns, order_by, file_name, dtypes=None):
+    total = row_count(source)
+    pages = max(1, -(-total // PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{source}_page")
+    offset = (page - 1) * PAGE_SIZE
+    st.dataframe(query_arrow(f"SELECT {columns} FROM {source} ORDER BY {order_by} LIMIT ? OFFSET ?",
+                             (PAGE_SIZE, offset), dtypes))
+    st.caption(f"Page {page} of {pages} ({total} records)")
+    full_sql = f"SELECT {columns} FROM {source} ORDER BY {order_by}"
+    # A callable defers the full-table export until the button is clicked
+    st.download_button("Download CSV", lambda: export_csv(full_sql), file_name, "text/csv")
+
+# --- CSV Import ---
+# Ages are held to the same 0-120 range as the Add Patient form; raises ValueError naming the problem
+def parse_patient_csv(data):
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    if not set(PATIENT_CSV_COLUMNS).issubset(reader.fieldnames or []):
+        raise ValueError("CSV must have the columns: " + ", ".join(PATIENT_CSV_COLUMNS))
+    rows, bad_lines = [], []
+    for row in reader:
+        try:
+            age = int(row["age"])
+        except (TypeError, ValueError):
+            age = None
+        if age is None or not 0 <= age <= 120:
+            bad_lines.append(reader.line_num)
+        else:
+            rows.append((row["name"], age, row["gender"], row["contact"]))
+    if bad_lines:
+        raise ValueError("Nothing imported. Age must be a whole number from 0 to 120 "
+                         "on lines: " + ", ".join(map(str, bad_lines)))
+    return rows
+
+# --- Authentication UI ---
+def auth_page(conn):
+    tab1, tab2, tab3 = st.tabs(["🔐 Login", "📝 Register", "🔄 Reset Password"])
+
+    with tab1:
+        st.title("🔐 Login")
+        username = st.text_input("Username", key="login_user")
+        password = st.text_input("Password", type="password", key="login_pass")
+        if st.button("Login"):
+            login(username, password, conn)
+
+    with tab2:
+        st.title("📝 Register")
+        new_user = st.text_input("Choose Username", key="reg_user")
+        new_pass = st.text_input("Choose Password", type="password", key="reg_pass")
+        role = st.selectbox("Role", ["admin", "doctor", "receptionist"])
+        if st.button("Register"):
+            register(new_user, new_pass, role, conn)
+
+    with tab3:
+        st.title("🔄 Reset Password")
+        user_reset = st.text_input("Enter your Username", key="reset_user")
+        new_pass = st.text_input("New Password", type="password", key="reset_pass")
+        if st.button("Reset Password"):
+            if reset_password(user_reset, new_pass, conn):
+                st.success("Password reset successfully!")
+            else:
+                st.error("Username does not exist.")
+
+# --- Main Dashboard ---
+def dashboard(conn):
+    st.sidebar.success(f"Logged in as {st.session_state.username} ({st.session_state.role})")
+    if st.sidebar.button("Logout"):
+        st.session_state.authenticated = False
+        st.session_state.username = None
+        st.session_state.role = None
+        st.rerun()
+
+    st.title("🏥 CareConnect Hospital Dashboard")
+    tab1, tab2, tab3, tab4 = st.tabs(["Patients", "Doctors", "Appointments", "Reports"])
+
+    with tab1:
+        patients_tab(conn)
+    with tab2:
+        doctors_tab(conn)
+    with tab3:
+        appointments_tab(conn)
+    with tab4:
+        reports_tab(conn)
+
+# --- Patients Tab ---
+def patients_tab(conn):
+    st.header("👩‍⚕️ Patient Records")
+    if st.toggle("Show All Patients"):
+        show_table("patients", "patient_id, name, age, gender, contact", "patient_id", "patients.csv",
+                   PATIENT_DTYPES)
+
+    if st.session_state.role in ["admin", "receptionist"]:
+        with st.form("add_patient_form"):
+            st.subheader("Add New Patient")
+            name = st.text_input("Name")
+            age = st.number_input("Age", min_value=0, max_value=120)
+            gender = st.selectbox("Gender", ["Male", "Female", "Other"])
+            contact = st.text_input("Contact")
+            submitted = st.form_submit_button("Add Patient")
+            if submitted:
+                conn.execute(INSERT_PATIENT, (name, age, gender, contact))
+                conn.commit()
+                clear_table_caches()
+                patient_options.clear()
+                st.success("Patient added successfully!")
+
+        # Cleared on submit so pressing Import again cannot insert the same file twice
+        with st.form("import_patients_form", clear_on_submit=True):
+            st.subheader("Import Patients")
+            uploaded = st.file_uploader("Upload CSV (name, age, gender, contact)", type="csv")
+            submitted = st.form_submit_button("Import Patients")
+            if submitted and uploaded is not None:
+                try:
+                    rows = parse_patient_csv(uploaded.getvalue())
+                except UnicodeDecodeError:
+                    st.error("Nothing imported. The CSV must be saved as UTF-8.")
+                except csv.Error as e:
+                    st.error(f"Nothing imported. The CSV could not be read: {e}")
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    with conn:
+                        conn.executemany(INSERT_PATIENT, rows)
+                    clear_table_caches()
+                    patient_options.clear()
+                    st.success(f"Imported {len(rows)} patients.")
+
+# --- Doctors Tab ---
+def doctors_tab(conn):
+    st.header("👩‍⚕️ Doctor Records")
+    if st.toggle("Show All Doctors"):
+        show_table("doctors", "doctor_id, name, specialty", "doctor_id", "doctors.csv")
+
+    if st.session_state.role in ["admin"]:
+        with st.form("add_doctor_form"):
+            st.subheader("Add New Doctor")
+            name = st.text_input("Doctor Name")
+            specialty = st.text_input("Specialty")
+            submitted = st.form_submit_button("Add Doctor")
+            if submitted:
+                conn.execute(INSERT_DOCTOR, (name, specialty))
+                conn.commit()
+                clear_table_caches()
+                doctor_options.clear()
+                st.success("Doctor added successfully!")
+
+# --- Appointments Tab ---
+def appointments_tab(conn):
+    st.header("🗓️ Appointments")
+    if st.toggle("Show All Appointments"):
+        show_table("appointments_view", "*", "appointment_id", "appointments.csv")
+
+    if st.session_state.role in ["admin", "receptionist"]:
+        with st.form("add_appointment_form"):
+            st.subheader("Book Appointment")
+            patients = dict(patient_options())
+            doctors = dict(doctor_options())
+            patient_id = st.selectbox("Select Patient", list(patients), format_func=patients.get)
+            doctor_id = st.selectbox("Select Doctor", list(doctors), format_func=doctors.get)
+            appointment_date = st.date_input("Appointment Date", value=date.today())
+            status = st.selectbox("Status", ["Scheduled", "Completed", "Cancelled"])
+            diagnosis = st.text_input("Diagnosis")
+            submitted = st.form_submit_button("Book Appointment")
+            if submitted and (patient_id is None or doctor_id is None):
+                st.error("Add at least one patient and one doctor before booking.")
+            elif submitted:
+                conn.execute(INSERT_APPOINTMENT,
+                             (patient_id, doctor_id, appointment_date, status, diagnosis))
+                conn.commit()
+                clear_table_caches()
+                st.success("Appointment booked successfully!")
+
+# --- Reports Tab ---
+def reports_tab(conn):
+    st.header("📊 Reports")
+    p, d, a = record_counts()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Patients", p)
+    col2.metric("Total Doctors", d)
+    col3.metric("Total Appointments", a)